@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from .core import Chatbot, AsyncChatbot
 from .enums import Model, Endpoint, Headers
-from .images import Image, WebImage, GeneratedImage
-from .utils import upload_file, load_cookies
+from .images import Image, WebImage, GeneratedImage, save_all
+from .utils import upload_file, upload_many, load_cookies, aclose_sessions
 
 __all__ = [
     "Chatbot",
@@ -13,6 +13,9 @@ __all__ = [
     "Image",
     "WebImage",
     "GeneratedImage",
+    "save_all",
     "upload_file",
+    "upload_many",
     "load_cookies",
+    "aclose_sessions",
 ]
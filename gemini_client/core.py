@@ -20,10 +20,6 @@ from curl_cffi.requests import AsyncSession
 # Import common request exceptions (curl_cffi often wraps these)
 from requests.exceptions import RequestException, Timeout, HTTPError
 
-# For image models using validation. Adjust based on organization internal pydantic.
-# Updated import for Pydantic V2
-from pydantic import BaseModel, field_validator
-
 # Rich is retained for logging within image methods.
 from rich.console import Console
 from rich.markdown import Markdown
@@ -143,9 +139,7 @@ class AsyncChatbot:
         model: Model = Model.UNSPECIFIED,
         impersonate: str = "chrome110", # Added impersonate
     ):
-        headers = Headers.GEMINI.value.copy()
-        if model != Model.UNSPECIFIED:
-            headers.update(model.model_header)
+        headers = {**Headers.GEMINI, **model.model_header}
         self._reqid = int("".join(random.choices(string.digits, k=7))) # Increased length for less collision chance
         self.proxy = proxy # Store original proxy setting
         self.impersonate = impersonate # Store impersonate setting
@@ -281,7 +275,7 @@ class AsyncChatbot:
         try:
             # Use the session's get method
             resp = await self.session.get(
-                Endpoint.INIT.value,
+                Endpoint.INIT,
                 timeout=self.timeout # Timeout is already set in session, but can override
                 # follow_redirects is handled automatically by curl_cffi
             )
@@ -326,8 +320,8 @@ class AsyncChatbot:
         """Rotates the __Secure-1PSIDTS cookie."""
         try:
             response = await self.session.post(
-                Endpoint.ROTATE_COOKIES.value,
-                headers=Headers.ROTATE_COOKIES.value,
+                Endpoint.ROTATE_COOKIES,
+                headers=Headers.ROTATE_COOKIES,
                 data='[000,"-0000000000000000000"]',
                 timeout=self.timeout
             )
@@ -398,7 +392,7 @@ class AsyncChatbot:
         try:
             # Send request
             resp = await self.session.post(
-                Endpoint.GENERATE.value,
+                Endpoint.GENERATE,
                 params=params,
                 data=data,
                 timeout=self.timeout,
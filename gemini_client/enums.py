@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
-from enum import Enum
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping
 
-class Endpoint(Enum):
+class Endpoint:
     """
-    Enum for Google Gemini API endpoints.
+    Google Gemini API endpoints.
 
     Attributes:
         INIT (str): URL for initializing the Gemini session.
@@ -16,16 +18,19 @@ class Endpoint(Enum):
     ROTATE_COOKIES = "https://accounts.google.com/RotateCookies"
     UPLOAD = "https://content-push.googleapis.com/upload"
 
-class Headers(Enum):
+class Headers:
     """
-    Enum for HTTP headers used in Gemini API requests.
+    HTTP headers used in Gemini API requests.
+
+    Each value is a read-only mapping shared by every request; merge it into
+    a new dict (e.g. ``{**Headers.GEMINI, **extra}``) to add headers.
 
     Attributes:
-        GEMINI (dict): Headers for Gemini chat requests.
-        ROTATE_COOKIES (dict): Headers for rotating cookies.
-        UPLOAD (dict): Headers for file/image upload.
+        GEMINI (Mapping): Headers for Gemini chat requests.
+        ROTATE_COOKIES (Mapping): Headers for rotating cookies.
+        UPLOAD (Mapping): Headers for file/image upload.
     """
-    GEMINI = {
+    GEMINI = MappingProxyType({
         "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
         "Host": "gemini.google.com",
         "Origin": "https://gemini.google.com",
@@ -33,84 +38,123 @@ class Headers(Enum):
         # User-Agent will be handled by curl_cffi impersonate
         # "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "X-Same-Domain": "1",
-    }
-    ROTATE_COOKIES = {
+    })
+    ROTATE_COOKIES = MappingProxyType({
         "Content-Type": "application/json",
-    }
-    UPLOAD = {"Push-ID": "feeds/mcudyrk2a4khkz"}
+    })
+    UPLOAD = MappingProxyType({"Push-ID": "feeds/mcudyrk2a4khkz"})
 
-class Model(Enum):
+class Model:
     """
-    Enum for available Gemini model configurations.
+    Gemini model configuration.
+
+    Each model is the single instance of its own subclass, with the attributes
+    stored as class-level constants; instances carry no per-instance state.
 
     Attributes:
         model_name (str): Name of the model.
-        model_header (dict): Additional headers required for the model.
+        model_header (Mapping): Additional headers required for the model (read-only).
         advanced_only (bool): Whether the model is available only for advanced users.
     """
-    # Updated model definitions based on reference implementation
-    UNSPECIFIED = ("unspecified", {}, False)
-    G_2_0_FLASH = (
-        "gemini-2.0-flash",
-        {"x-goog-ext-525001261-jspb": '[1,null,null,null,"f299729663a2343f"]'},
-        False,
-    )
-    G_2_0_FLASH_THINKING = (
-        "gemini-2.0-flash-thinking",
-        {"x-goog-ext-525001261-jspb": '[null,null,null,null,"7ca48d02d802f20a"]'},
-        False,
-    )
-    G_2_5_FLASH = (
-        "gemini-2.5-flash",
-        {"x-goog-ext-525001261-jspb": '[1,null,null,null,"35609594dbe934d8"]'},
-        False,
-    )
-    G_2_5_PRO = (
-        "gemini-2.5-pro",
-        {"x-goog-ext-525001261-jspb": '[1,null,null,null,"2525e3954d185b3c"]'},
-        False,
-    )
-    G_2_0_EXP_ADVANCED = (
-        "gemini-2.0-exp-advanced",
-        {"x-goog-ext-525001261-jspb": '[null,null,null,null,"b1e46a6037e6aa9f"]'},
-        True,
-    )
-    G_2_5_EXP_ADVANCED = (
-        "gemini-2.5-exp-advanced",
-        {"x-goog-ext-525001261-jspb": '[null,null,null,null,"203e6bb81620bcfe"]'},
-        True,
-    )
-
-    def __init__(self, name, header, advanced_only):
-        """
-        Initialize a Model enum member.
+    __slots__ = ()
 
-        Args:
-            name (str): Model name.
-            header (dict): Model-specific headers.
-            advanced_only (bool): If True, model is for advanced users only.
-        """
-        self.model_name = name
-        self.model_header = header
-        self.advanced_only = advanced_only
+    model_name: str
+    model_header: Mapping[str, str]
+    advanced_only: bool
+
+    def __repr__(self):
+        return f"Model.{type(self).__name__}"
+
+    def __reduce__(self):
+        # Pickles and copies resolve back to the module-level constant
+        return (Model.from_name, (self.model_name,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     @classmethod
-    def from_name(cls, name: str):
+    def from_name(cls, name: str) -> "Model":
         """
-        Get a Model enum member by its model name.
+        Get a Model by its model name.
 
         Args:
             name (str): Name of the model.
 
         Returns:
-            Model: Corresponding Model enum member.
+            Model: Corresponding Model instance.
 
         Raises:
             ValueError: If the model name is not found.
         """
-        for model in cls:
-            if model.model_name == name:
-                return model
-        raise ValueError(
-            f"Unknown model name: {name}. Available models: {', '.join([model.model_name for model in cls])}"
-        )
+        try:
+            return _BY_NAME[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown model name: {name}. Available models: {', '.join(_BY_NAME)}"
+            ) from None
+
+# Model-selection header key, shared by every model's header dict
+_JSPB = sys.intern("x-goog-ext-525001261-jspb")
+
+def _define_model(name: str, model_name: str, model_header: Dict[str, str], advanced_only: bool) -> Model:
+    """Create the single instance of a new Model subclass holding the given constants."""
+    cls = type(name, (Model,), {
+        "__slots__": (),
+        "model_name": model_name,
+        "model_header": MappingProxyType(model_header),
+        "advanced_only": advanced_only,
+    })
+    return cls()
+
+# Updated model definitions based on reference implementation
+Model.UNSPECIFIED = _define_model("UNSPECIFIED", "unspecified", {}, False)
+Model.G_2_0_FLASH = _define_model(
+    "G_2_0_FLASH",
+    "gemini-2.0-flash",
+    {_JSPB: '[1,null,null,null,"f299729663a2343f"]'},
+    False,
+)
+Model.G_2_0_FLASH_THINKING = _define_model(
+    "G_2_0_FLASH_THINKING",
+    "gemini-2.0-flash-thinking",
+    {_JSPB: '[null,null,null,null,"7ca48d02d802f20a"]'},
+    False,
+)
+Model.G_2_5_FLASH = _define_model(
+    "G_2_5_FLASH",
+    "gemini-2.5-flash",
+    {_JSPB: '[1,null,null,null,"35609594dbe934d8"]'},
+    False,
+)
+Model.G_2_5_PRO = _define_model(
+    "G_2_5_PRO",
+    "gemini-2.5-pro",
+    {_JSPB: '[1,null,null,null,"2525e3954d185b3c"]'},
+    False,
+)
+Model.G_2_0_EXP_ADVANCED = _define_model(
+    "G_2_0_EXP_ADVANCED",
+    "gemini-2.0-exp-advanced",
+    {_JSPB: '[null,null,null,null,"b1e46a6037e6aa9f"]'},
+    True,
+)
+Model.G_2_5_EXP_ADVANCED = _define_model(
+    "G_2_5_EXP_ADVANCED",
+    "gemini-2.5-exp-advanced",
+    {_JSPB: '[null,null,null,null,"203e6bb81620bcfe"]'},
+    True,
+)
+
+_ALL = (
+    Model.UNSPECIFIED,
+    Model.G_2_0_FLASH,
+    Model.G_2_0_FLASH_THINKING,
+    Model.G_2_5_FLASH,
+    Model.G_2_5_PRO,
+    Model.G_2_0_EXP_ADVANCED,
+    Model.G_2_5_EXP_ADVANCED,
+)
+_BY_NAME: Dict[str, Model] = {m.model_name: m for m in _ALL}
@@ -1,21 +1,37 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import contextlib
+import itertools
 import os
-import random
-import re
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, Union, Optional
+from typing import Dict, Iterable, List, Union, Optional
+from urllib.parse import urlparse, unquote_to_bytes
 
-from pydantic import BaseModel, field_validator
+import aiofiles
+import aiofiles.os
 from curl_cffi import CurlError
-from curl_cffi.requests import AsyncSession
 from requests.exceptions import HTTPError, RequestException # Ensure RequestException is imported
 
 from rich.console import Console
 
+from .utils import _get_session
+
 console = Console() # Instantiate console for logging
 
-class Image(BaseModel):
+# 256-byte table mapping characters not allowed in filenames to "_"
+_BYTES_FN_TABLE = bytes(ord("_") if c in b'<>:"/\\|?*' else c for c in range(256))
+
+# Source of unique fallback filenames when none can be derived from the URL;
+# the start time and pid keep names from separate runs from overwriting each other
+_fallback_prefix = f"image_{datetime.now():%Y%m%d%H%M%S}_{os.getpid()}"
+_fallback_ctr = itertools.count()
+
+# Source of unique temp-file suffixes for in-progress downloads
+_part_ctr = itertools.count()
+
+@dataclass(slots=True)
+class Image:
     """
     Represents a single image object returned from Gemini.
 
@@ -24,6 +40,7 @@ class Image(BaseModel):
         title (str): Title of the image (default: "[Image]").
         alt (str): Optional description of the image.
         proxy (str | dict | None): Proxy used when saving the image.
+        proxies_dict (dict | None): Proxy dictionary for curl_cffi (derived from proxy).
         impersonate (str): Browser profile for curl_cffi to impersonate.
     """
     url: str
@@ -31,13 +48,21 @@ class Image(BaseModel):
     alt: str = ""
     proxy: Optional[Union[str, Dict[str, str]]] = None
     impersonate: str = "chrome110"
+    proxies_dict: Optional[Dict[str, str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Build the curl_cffi proxy dictionary once per instance
+        if isinstance(self.proxy, str):
+            self.proxies_dict = {"http": self.proxy, "https": self.proxy}
+        else:
+            self.proxies_dict = self.proxy
 
     def __str__(self):
         return f"{self.title}({self.url}) - {self.alt}"
 
     def __repr__(self):
-        short_url = self.url if len(self.url) <= 50 else self.url[:20] + "..." + self.url[-20:]
-        short_alt = self.alt[:30] + "..." if len(self.alt) > 30 else self.alt
+        short_url = self.url if len(self.url) <= 50 else f"{self.url[:20]}...{self.url[-20:]}"
+        short_alt = self.alt if len(self.alt) <= 30 else f"{self.alt[:30]}..."
         return f"Image(title='{self.title}', url='{short_url}', alt='{short_alt}')"
 
     async def save(
@@ -71,21 +96,20 @@ class Image(BaseModel):
         # Generate filename from URL if not provided
         if not filename:
             try:
-                from urllib.parse import urlparse, unquote
                 parsed_url = urlparse(self.url)
-                base_filename = os.path.basename(unquote(parsed_url.path))
+                base_filename = os.path.basename(unquote_to_bytes(parsed_url.path))
                 # Remove invalid characters for filenames
-                safe_filename = re.sub(r'[<>:"/\|?*]', '_', base_filename)
+                safe_filename = base_filename.translate(_BYTES_FN_TABLE).decode("utf-8", errors="replace")
                 if safe_filename and len(safe_filename) > 0:
                     filename = safe_filename
                 else:
-                    filename = f"image_{random.randint(1000, 9999)}.jpg"
+                    filename = f"{_fallback_prefix}_{next(_fallback_ctr)}.jpg"
             except Exception:
-                filename = f"image_{random.randint(1000, 9999)}.jpg"
+                filename = f"{_fallback_prefix}_{next(_fallback_ctr)}.jpg"
 
         # Validate filename length
         try:
-            _ = Path(filename)
+            filename = os.fsdecode(filename)
             max_len = 255
             if len(filename) > max_len:
                 name, ext = os.path.splitext(filename)
@@ -97,29 +121,21 @@ class Image(BaseModel):
                 if verbose:
                     console.log("[yellow]Skipping save due to invalid filename.[/yellow]")
                 return None
-            filename = f"image_{random.randint(1000, 9999)}.jpg"
+            filename = f"{_fallback_prefix}_{next(_fallback_ctr)}.jpg"
             if verbose:
                 console.log(f"[yellow]Using fallback filename: {filename}[/yellow]")
 
-        # Prepare proxy dictionary for curl_cffi
-        proxies_dict = None
-        if isinstance(self.proxy, str):
-            proxies_dict = {"http": self.proxy, "https": self.proxy}
-        elif isinstance(self.proxy, dict):
-            proxies_dict = self.proxy
+        dest = os.path.join(path, filename)
+        part = None
 
         try:
-            # Use AsyncSession from curl_cffi
-            async with AsyncSession(
-                cookies=cookies,
-                proxies=proxies_dict,
-                impersonate=self.impersonate
-                # follow_redirects is handled automatically by curl_cffi
-            ) as client:
-                if verbose:
-                    console.log(f"Attempting to download image from: {self.url}")
+            # Reuse a shared AsyncSession from curl_cffi
+            client = _get_session(self.proxies_dict, self.impersonate)
+            if verbose:
+                console.log(f"Attempting to download image from: {self.url}")
 
-                response = await client.get(self.url)
+            # Stream the body to disk as libcurl delivers it instead of buffering the whole response
+            async with client.stream("GET", self.url, cookies=cookies) as response:
                 response.raise_for_status()
 
                 # Check content type
@@ -127,18 +143,23 @@ class Image(BaseModel):
                 if "image" not in content_type and verbose:
                     console.log(f"[yellow]Warning: Content type is '{content_type}', not an image. Saving anyway.[/yellow]")
 
-                # Create directory and save file
-                dest_path = Path(path)
-                dest_path.mkdir(parents=True, exist_ok=True)
-                dest = dest_path / filename
+                # Create directory (off the event loop) and save file
+                await aiofiles.os.makedirs(path, exist_ok=True)
 
-                # Write image data to file
-                dest.write_bytes(response.content)
+                # Write image data to a temp file as it arrives, then move it into
+                # place so a failed transfer never leaves a truncated image behind
+                part = os.path.join(path, f".{os.getpid()}-{next(_part_ctr)}.part")
+                async with aiofiles.open(part, "xb") as f:
+                    async for chunk in response.aiter_content():
+                        await f.write(chunk)
 
-                if verbose:
-                    console.log(f"Image saved successfully as {dest.resolve()}")
+            await aiofiles.os.replace(part, dest)
+            part = None
+            dest = os.path.abspath(dest)
+            if verbose:
+                console.log(f"Image saved successfully as {dest}")
 
-                return str(dest.resolve())
+            return dest
 
         except HTTPError as e:
             console.log(f"[red]Error downloading image {self.url}: {e.response.status_code} {e}[/red]")
@@ -152,8 +173,14 @@ class Image(BaseModel):
         except Exception as e:
             console.log(f"[red]An unexpected error occurred during image save: {e}[/red]")
             raise
+        finally:
+            # Remove the partial download if the save did not complete
+            if part is not None:
+                with contextlib.suppress(OSError):
+                    await aiofiles.os.remove(part)
 
 
+@dataclass(slots=True, repr=False)
 class WebImage(Image):
     """
     Represents an image retrieved from web search results.
@@ -162,6 +189,7 @@ class WebImage(Image):
     """
     pass
 
+@dataclass(slots=True, repr=False, kw_only=True)
 class GeneratedImage(Image):
     """
     Represents an image generated by Google's AI image generator (e.g., ImageFX).
@@ -172,14 +200,12 @@ class GeneratedImage(Image):
     """
     cookies: Dict[str, str]
 
-    # Updated validator for Pydantic V2
-    @field_validator("cookies")
-    @classmethod
-    def validate_cookies(cls, v: Dict[str, str]) -> Dict[str, str]:
+    def __post_init__(self):
         """Ensures cookies are provided for generated images."""
-        if not v or not isinstance(v, dict):
+        # Explicit base call: zero-argument super() does not work in slots dataclasses
+        Image.__post_init__(self)
+        if not self.cookies or not isinstance(self.cookies, dict):
             raise ValueError("GeneratedImage requires a dictionary of cookies from the client.")
-        return v
 
     async def save(self, **kwargs) -> Optional[str]:
         """
@@ -199,4 +225,39 @@ class GeneratedImage(Image):
              kwargs["filename"] = f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{url_part}{ext}"
 
         # Pass the required cookies and other args (like impersonate) to the parent save method
-        return await super().save(cookies=self.cookies, **kwargs)
+        return await Image.save(self, cookies=self.cookies, **kwargs)
+
+
+async def save_all(
+    images: Iterable[Image],
+    concurrency: int = 8,
+    **kwargs,
+) -> List[Union[Optional[str], BaseException]]:
+    """
+    Save several images concurrently.
+
+    Parameters:
+        images: Iterable[Image]
+            Images (WebImage or GeneratedImage) to save.
+        concurrency: int, optional
+            Maximum number of downloads in flight at once (default 8).
+        Additional arguments (except filename) are passed to each image's save method.
+    Returns:
+        List with one entry per image, in input order: the saved path (or None
+        if skipped), or the exception raised while saving that image.
+    Raises:
+        ValueError if a fixed filename is given, since every image would be
+        written to the same path, or if concurrency is less than 1.
+    """
+    if "filename" in kwargs:
+        raise ValueError("save_all does not accept filename; each image derives its own.")
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _save_one(image: Image) -> Optional[str]:
+        async with semaphore:
+            return await image.save(**kwargs)
+
+    return await asyncio.gather(*(_save_one(image) for image in images), return_exceptions=True)
@@ -1,19 +1,78 @@
 # -*- coding: utf-8 -*-
-import json
+import asyncio
+import functools
+import os
 from pathlib import Path
-from typing import Dict, Tuple, Union, Optional
+from typing import Dict, Iterable, List, Tuple, Union, Optional
 
-from curl_cffi import CurlError
+import orjson
+from curl_cffi import CurlError, CurlMime
 from curl_cffi.requests import AsyncSession
 from requests.exceptions import RequestException, HTTPError, Timeout # Added Timeout
 
 from rich.console import Console
 
-# Assuming Endpoint and Headers enums are in 'enums.py' within the same package
+# Endpoint and Headers live in 'enums.py' within the same package
 from .enums import Endpoint, Headers
 
 console = Console() # Instantiate console for logging
 
+# Long-lived sessions keyed by (event loop, proxies, impersonate profile)
+_sessions: Dict[tuple, AsyncSession] = {}
+
+def _get_session(
+    proxies: Optional[Dict[str, str]] = None,
+    impersonate: str = "chrome110"
+) -> AsyncSession:
+    """
+    Returns a shared curl_cffi AsyncSession for the running event loop.
+
+    Reusing one session per proxy/impersonate pair keeps connections (and their
+    TLS state) alive between image downloads and file uploads. The session never
+    stores cookies, so cookies passed to (or set by) one request are not replayed
+    on later ones. Sessions belonging to event loops that have since been closed
+    are dropped on the next miss; call aclose_sessions() before shutting a loop
+    down to close them properly.
+
+    Args:
+        proxies (dict, optional): curl_cffi-compatible proxy dictionary.
+        impersonate (str, optional): Browser profile for curl_cffi to impersonate.
+
+    Returns:
+        AsyncSession: Session bound to the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, tuple(sorted(proxies.items())) if proxies else None, impersonate)
+    session = _sessions.get(key)
+    if session is None:
+        for stale in [k for k in _sessions if k[0].is_closed()]:
+            del _sessions[stale]
+        session = _sessions[key] = AsyncSession(
+            proxies=proxies,
+            impersonate=impersonate,
+            discard_cookies=True # Keep no state between unrelated requests
+        )
+    return session
+
+async def aclose_sessions() -> None:
+    """
+    Closes the shared sessions created for the running event loop.
+
+    Callers must await this before their event loop ends (e.g. at the end of the
+    coroutine passed to asyncio.run) if they used upload_file, upload_many,
+    Image.save or save_all. Neither AsyncChatbot nor Chatbot calls it for you,
+    and sessions left behind by a closed loop can no longer be closed; they are
+    only dropped, keeping their curl handles open until garbage collection.
+
+    Sessions are created again on demand, so it is safe to keep using
+    upload_file or Image.save afterwards.
+    """
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _sessions if k[0] is loop or k[0].is_closed()]:
+        session = _sessions.pop(key)
+        if key[0] is loop:
+            await session.close()
+
 async def upload_file(
     file: Union[bytes, str, Path],
     proxy: Optional[Union[str, Dict[str, str]]] = None,
@@ -35,15 +94,11 @@ async def upload_file(
         RequestException: For other network-related errors.
         FileNotFoundError: If the file path does not exist.
     """
-    # Handle file input
+    # Validate file input before allocating any curl handles
     if not isinstance(file, bytes):
         file_path = Path(file)
         if not file_path.is_file():
             raise FileNotFoundError(f"File not found at path: {file}")
-        with open(file_path, "rb") as f:
-            file_content = f.read()
-    else:
-        file_content = file
 
     # Prepare proxy dictionary for curl_cffi
     proxies_dict = None
@@ -52,31 +107,98 @@ async def upload_file(
     elif isinstance(proxy, dict):
         proxies_dict = proxy # Assume it's already in the correct format
 
+    multipart = CurlMime()
     try:
-        # Use AsyncSession from curl_cffi
-        async with AsyncSession(
-            proxies=proxies_dict,
-            impersonate=impersonate,
-            headers=Headers.UPLOAD.value # Pass headers directly
-            # follow_redirects is handled automatically by curl_cffi
-        ) as client:
-            response = await client.post(
-                url=Endpoint.UPLOAD.value, # Use Endpoint enum
-                files={"file": file_content},
-            )
-            response.raise_for_status() # Raises HTTPError for bad responses
-            return response.text
+        # Paths are streamed from disk by libcurl rather than read into memory,
+        # bytes are attached as-is
+        if isinstance(file, bytes):
+            multipart.addpart(name="file", filename="file", data=file)
+        else:
+            multipart.addpart(name="file", filename=file_path.name, local_path=file_path)
+
+        # Reuse a shared AsyncSession from curl_cffi
+        client = _get_session(proxies_dict, impersonate)
+        response = await client.post(
+            url=Endpoint.UPLOAD,
+            headers=Headers.UPLOAD, # Pass headers per request
+            multipart=multipart,
+        )
+        response.raise_for_status() # Raises HTTPError for bad responses
+        return response.text
     except HTTPError as e:
         console.log(f"[red]HTTP error during file upload: {e.response.status_code} {e}[/red]")
         raise # Re-raise HTTPError
     except (RequestException, CurlError) as e: # Catch CurlError as well
         console.log(f"[red]Network error during file upload: {e}[/red]")
         raise # Re-raise other request errors
+    finally:
+        multipart.close()
+
+async def upload_many(
+    files: Iterable[Union[bytes, str, Path]],
+    concurrency: int = 4,
+    proxy: Optional[Union[str, Dict[str, str]]] = None,
+    impersonate: str = "chrome110"
+) -> List[Union[str, BaseException]]:
+    """
+    Uploads several files concurrently over one shared session.
+
+    Args:
+        files (Iterable[bytes | str | Path]): File data or paths to upload.
+        concurrency (int, optional): Maximum number of uploads in flight at once. Defaults to 4.
+        proxy (str | dict, optional): Proxy URL or dictionary for the requests.
+        impersonate (str, optional): Browser profile for curl_cffi to impersonate. Defaults to "chrome110".
+
+    Returns:
+        list: One entry per file, in input order: the uploaded file's identifier,
+            or the exception raised while uploading it.
+
+    Raises:
+        ValueError: If concurrency is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _upload_one(file: Union[bytes, str, Path]) -> str:
+        async with semaphore:
+            return await upload_file(file, proxy=proxy, impersonate=impersonate)
+
+    return await asyncio.gather(*(_upload_one(file) for file in files), return_exceptions=True)
+
+@functools.lru_cache(maxsize=32)
+def _load_cookies_cached(cookie_path: str, mtime_ns: int) -> Tuple[str, str]:
+    """
+    Parses the cookie file; cached per (path, modification time).
+
+    Raises the underlying errors unchanged; load_cookies turns them into messages.
+    """
+    with open(cookie_path, 'rb') as file:
+        cookies = orjson.loads(file.read())
+    # Single pass over the cookie list, stopping once both values are found.
+    # Handle potential variations in cookie names (case-insensitivity)
+    session_auth1 = session_auth2 = None
+    for item in cookies:
+        name = item['name'].upper()
+        if name == '__SECURE-1PSID' and not session_auth1:
+            session_auth1 = item['value']
+        elif name == '__SECURE-1PSIDTS' and not session_auth2:
+            session_auth2 = item['value']
+        if session_auth1 and session_auth2:
+            break
+
+    if not session_auth1 or not session_auth2:
+         raise StopIteration("Required cookies (__Secure-1PSID or __Secure-1PSIDTS) not found.")
+
+    return session_auth1, session_auth2
 
 def load_cookies(cookie_path: str) -> Tuple[str, str]:
     """
     Loads authentication cookies from a JSON file.
 
+    The parsed result is cached until the file's modification time changes.
+
     Args:
         cookie_path (str): Path to the JSON file containing cookies.
 
@@ -87,19 +209,11 @@ def load_cookies(cookie_path: str) -> Tuple[str, str]:
         Exception: If the file is not found, invalid, or required cookies are missing.
     """
     try:
-        with open(cookie_path, 'r', encoding='utf-8') as file: # Added encoding
-            cookies = json.load(file)
-        # Handle potential variations in cookie names (case-insensitivity)
-        session_auth1 = next((item['value'] for item in cookies if item['name'].upper() == '__SECURE-1PSID'), None)
-        session_auth2 = next((item['value'] for item in cookies if item['name'].upper() == '__SECURE-1PSIDTS'), None)
-
-        if not session_auth1 or not session_auth2:
-             raise StopIteration("Required cookies (__Secure-1PSID or __Secure-1PSIDTS) not found.")
-
-        return session_auth1, session_auth2
+        mtime_ns = os.stat(cookie_path).st_mtime_ns
+        return _load_cookies_cached(os.fspath(cookie_path), mtime_ns)
     except FileNotFoundError:
         raise Exception(f"Cookie file not found at path: {cookie_path}")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         raise Exception("Invalid JSON format in the cookie file.")
     except StopIteration as e:
         raise Exception(f"{e} Check the cookie file format and content.")
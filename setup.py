@@ -21,10 +21,11 @@ setup(
         "Topic :: Internet :: WWW/HTTP",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.7", # Based on f-strings, asyncio, pydantic v2 features
+    python_requires=">=3.10", # dataclass(slots=True, kw_only=True) for image models
     install_requires=[
-        "curl_cffi>=0.5.9",
-        "pydantic>=2.0",
+        "curl_cffi>=0.12.0",
+        "aiofiles>=23.1",
+        "orjson>=3.0",
         "rich>=10.0",
         "requests>=2.20",
     ],